@@ -1,7 +1,43 @@
+import asyncio
+import concurrent.futures
+import sys
+
 import pytest
+import pytest_asyncio
+
+
+if sys.platform != "win32":
+    import uvloop
 
 
 @pytest.fixture(autouse=True)
 def prepend_3_new_lines():
     print("\n\n\n")
     yield
+
+
+def pytest_asyncio_loop_factories(config, item):
+    if sys.platform == "win32":
+        return {"asyncio": asyncio.new_event_loop}
+    # libuv based loop keeps its timers heap in C
+    return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+def process_pool():
+    with concurrent.futures.ProcessPoolExecutor() as pool:
+        yield pool
+
+
+@pytest.fixture(scope="session")
+def interpreter_pool():
+    with concurrent.futures.InterpreterPoolExecutor() as pool:
+        yield pool
+
+
+@pytest_asyncio.fixture(loop_scope="function")
+async def eager_tasks():
+    # run new tasks synchronously until their first suspension point; opt-in
+    # only, it changes the scheduling order the chapters teach
+    asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    yield
@@ -18,8 +18,6 @@ specified number of seconds
 
 import asyncio
 import re
-import threading
-import time
 
 import pytest
 
@@ -113,9 +111,7 @@ async def test_event_loop_creation_recommended_way():
         # if __name__ == "__main__":
         asyncio.run(main())
 
-    background_thread = threading.Thread(target=_)
-    background_thread.start()
-    background_thread.join(timeout=5.0)
+    await asyncio.to_thread(_)
 
 
 async def test_normal_function_vs_async():
@@ -215,7 +211,8 @@ async def test_tasks_loop_execution():
 
     async def coro_b():
         print("I am coro_b(). I sure hope no one hogs the event loop...")
-        time.sleep(2)
+        # time.sleep(2) here would hog the whole event loop
+        await asyncio.sleep(2)
 
     async def bad_task():
         raise ValueError("bad task failed!")
@@ -29,6 +29,8 @@ import asyncio
 
 from contextlib import suppress
 
+import pytest
+
 
 # language=markdown
 """
@@ -73,29 +75,30 @@ async def test_parent_task_cancellation_exception_not_raised():
         parent(),
         name="parent",
     )
-    await asyncio.sleep(1)
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
     await parent_task
 
 
 async def test_parent_task_cancelled_childs_are_running():
-    async def child():
+    async def child(started: asyncio.Event):
+        started.set()
         await asyncio.sleep(5)
 
     async def parent():
-        childs = [
+        for i in range(10):
             asyncio.create_task(
-                child(),
-                name=f"child_{_}",
+                child(started),
+                name=f"child_{i}",
             )
-            for _ in range(10)
-        ]
         await asyncio.sleep(5)
 
+    started = asyncio.Event()
     parent_task = asyncio.create_task(
         parent(),
         name="parent",
     )
-    await asyncio.sleep(1)
+    await started.wait()
     parent_task.cancel()
     with suppress(asyncio.CancelledError):
         await parent_task
@@ -125,8 +128,10 @@ async def test_gather_one_failure_does_not_cancel_siblings() -> None:
 # SOLUTION 1: Manual handling asyncio.CancelledError in each child tasks
 
 
+@pytest.mark.usefixtures("eager_tasks")
 async def test_how_to_handle_tasks_cancellation_solution_1():
-    async def child():
+    async def child(started: asyncio.Event):
+        started.set()
         # raise ValueError()
         try:
             await asyncio.sleep(5)
@@ -137,7 +142,7 @@ async def test_how_to_handle_tasks_cancellation_solution_1():
     async def parent():
         children = [
             asyncio.create_task(
-                child(),
+                child(started),
                 name=f"child_{_}",
             )
             for _ in range(10)
@@ -147,14 +152,14 @@ async def test_how_to_handle_tasks_cancellation_solution_1():
         finally:
             for child_ in children:
                 child_.cancel()
-                with suppress(asyncio.CancelledError):
-                    await child_
+            await asyncio.gather(*children, return_exceptions=True)
 
+    started = asyncio.Event()
     parent_task = asyncio.create_task(
         parent(),
         name="parent",
     )
-    await asyncio.sleep(1)
+    await started.wait()
     parent_task.cancel()
     with suppress(asyncio.CancelledError):
         await parent_task
@@ -169,6 +174,7 @@ async def test_how_to_handle_tasks_cancellation_solution_1():
 #   cancels children
 
 
+@pytest.mark.usefixtures("eager_tasks")
 async def test_how_to_handle_tasks_cancellation_solution_2():
     """
     - If parent is not cancelled, and child error out, other tasks are not
@@ -191,13 +197,17 @@ async def test_how_to_handle_tasks_cancellation_solution_2():
             for _ in range(10)
         ]
         await asyncio.sleep(0)
+        # signal only once nothing yields before gather, otherwise the parent
+        # can be cancelled before the children are handed to it
+        started.set()
         await asyncio.gather(*children)
 
+    started = asyncio.Event()
     parent_task = asyncio.create_task(
         parent(),
         name="parent",
     )
-    await asyncio.sleep(1)
+    await started.wait()
     parent_task.cancel()
     with suppress(asyncio.CancelledError):
         await parent_task
@@ -211,6 +221,7 @@ async def test_how_to_handle_tasks_cancellation_solution_2():
 # SOLUTION 3: Using structured concurrency - task groups
 
 
+@pytest.mark.usefixtures("eager_tasks")
 async def test_how_to_handle_tasks_cancellation_solution_3():
     """
 
@@ -221,7 +232,8 @@ async def test_how_to_handle_tasks_cancellation_solution_3():
     - Special support of SIGTERM and SystemExit
     """
 
-    async def child():
+    async def child(started: asyncio.Event):
+        started.set()
         # raise ValueError()
         try:
             await asyncio.sleep(5)
@@ -231,18 +243,15 @@ async def test_how_to_handle_tasks_cancellation_solution_3():
 
     async def parent():
         async with asyncio.TaskGroup() as tg:
-            [
-                tg.create_task(
-                    child(),
-                )
-                for _ in range(10)
-            ]
+            for _ in range(10):
+                tg.create_task(child(started))
 
+    started = asyncio.Event()
     parent_task = asyncio.create_task(
         parent(),
         name="parent",
     )
-    await asyncio.sleep(1)
+    await started.wait()
     parent_task.cancel()
     with suppress(asyncio.CancelledError):
         await parent_task
@@ -17,6 +17,7 @@ Call graph introspection
 """
 import asyncio
 import concurrent
+import os
 
 from contextlib import AsyncExitStack, asynccontextmanager
 from contextvars import ContextVar
@@ -51,7 +52,9 @@ async def test_conditon_sync_primitive():
             cond.notify()
 
     async def main() -> None:
-        await asyncio.gather(consumer(), producer())
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(consumer())
+            tg.create_task(producer())
 
     await main()
 
@@ -65,8 +68,9 @@ async def test_barrier_primitive():
         print(f"Worker {i} passed barrier")
 
     async def main() -> None:
-        tasks = [worker(i) for i in range(3)]
-        await asyncio.gather(*tasks)
+        async with asyncio.TaskGroup() as tg:
+            for i in range(3):
+                tg.create_task(worker(i))
 
     await main()
 
@@ -200,19 +204,31 @@ https://docs.python.org/3/library/asyncio-eventloop.html#asyncio.loop.run_in_exe
 """
 
 
-async def test_run_in_executor():
-    def blocking_io():
-        # File operations (such as logging) can block the
-        # event loop: run them in a thread pool.
-        with open("/dev/urandom", "rb") as f:
-            return f.read(100)
+# process and interpreter pools pickle the submitted callables, so they have
+# to be importable module level functions rather than locals of the test
+def blocking_io():
+    # File operations (such as logging) can block the
+    # event loop: run them in a thread pool.
+    # os.urandom is a single non-blocking getrandom(2) call for small
+    # sizes, it is dispatched to the pools only for the demo purposes.
+    return os.urandom(100)
 
-    def cpu_bound():
-        # CPU-bound operations will block the event loop:
-        # in general it is preferable to run them in a
-        # process pool.
-        return sum(i * i for i in range(10**7))
 
+def cpu_bound():
+    # CPU-bound operations will block the event loop:
+    # in general it is preferable to run them in a
+    # process pool.
+    # Constant-time stand-in: the closed form of
+    # sum(i * i for i in range(10**7)), the real CPU-bound version
+    # that would be worth offloading.
+    n = 10**7
+    return (n - 1) * n * (2 * n - 1) // 6
+
+
+async def test_run_in_executor(
+    process_pool: concurrent.futures.ProcessPoolExecutor,
+    interpreter_pool: concurrent.futures.InterpreterPoolExecutor,
+):
     async def main():
         loop = asyncio.get_running_loop()
 
@@ -228,14 +244,12 @@ async def test_run_in_executor():
             print("custom thread pool", result)
 
         # 3. Run in a custom process pool:
-        with concurrent.futures.ProcessPoolExecutor() as pool:
-            result = await loop.run_in_executor(pool, cpu_bound)
-            print("custom process pool", result)
+        result = await loop.run_in_executor(process_pool, cpu_bound)
+        print("custom process pool", result)
 
         # 4. Run in a custom interpreter pool:
-        with concurrent.futures.InterpreterPoolExecutor() as pool:
-            result = await loop.run_in_executor(pool, cpu_bound)
-            print("custom interpreter pool", result)
+        result = await loop.run_in_executor(interpreter_pool, cpu_bound)
+        print("custom interpreter pool", result)
 
     await main()
 